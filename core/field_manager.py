@@ -6,9 +6,15 @@ This module handles creation, validation, and updates of the rotation field
 used to store feature rotation angles.
 """
 
-from qgis.core import QgsField, QgsProperty
+from typing import Optional
+from qgis.core import (
+    QgsFeatureSource,
+    QgsField,
+    QgsProperty,
+    QgsVectorDataProvider
+)
 from qgis.PyQt.QtCore import QVariant
-from .helpers import LayerEditingContext
+from .helpers import LayerEditingContext, MessageHelper
 
 
 class RotationFieldManager:
@@ -23,15 +29,54 @@ class RotationFieldManager:
     """
     
     ROTATION_FIELD = '_rotation_'
+    ROTATION_FIELD_EXPR = f'"{ROTATION_FIELD}"'
     
-    def __init__(self, layer):
+    # Template for the rotation field, copied for each layer it is added to
+    _ROTATION_QFIELD = QgsField(ROTATION_FIELD, QVariant.Double)
+    
+    # Shared data-defined property reading the rotation field, built on first use
+    _ROTATION_PROP = None
+    
+    def __init__(self, layer, message_helper: Optional[MessageHelper] = None):
         """
         Initialize the field manager.
         
         Args:
             layer: The QgsVectorLayer to manage rotation fields for
+            message_helper: Optional MessageHelper for reporting index problems
         """
         self.layer = layer
+        self.message_helper = message_helper
+        self._started_editing = False
+        self._edit_command_open = False
+        self._index_pending = False
+        self._spatial_index_checked = False
+        self._dynamic_prop = QgsProperty()
+        
+        # Field index cache, cleared whenever the layer's fields change
+        self._cached_index: Optional[int] = None
+        self.layer.updatedFields.connect(self._invalidate_index)
+        
+        # Saving or toggling editing outside the tool ends the session
+        # and clears the undo stack, including any open edit command
+        self.layer.editingStopped.connect(self._on_editing_stopped)
+        
+        # Committing also clears the undo stack, even when editing continues
+        # (Save Layer Edits), and indexes wait for the rotation field to be
+        # committed by whoever commits the edit session
+        self.layer.afterCommitChanges.connect(self._on_after_commit)
+    
+    @classmethod
+    def _rotation_property(cls) -> QgsProperty:
+        """
+        Get the data-defined property that reads the rotation field.
+        
+        Returns:
+            QgsProperty: Expression property referencing the rotation field
+        """
+        if cls._ROTATION_PROP is None:
+            cls._ROTATION_PROP = QgsProperty.fromExpression(cls.ROTATION_FIELD_EXPR)
+        return cls._ROTATION_PROP
     
     def get_field_index(self) -> int:
         """
@@ -40,7 +85,38 @@ class RotationFieldManager:
         Returns:
             int: Field index, or -1 if the field doesn't exist
         """
-        return self.layer.fields().indexOf(self.ROTATION_FIELD)
+        if self._cached_index is None:
+            self._cached_index = self.layer.fields().indexOf(self.ROTATION_FIELD)
+        return self._cached_index
+    
+    def _invalidate_index(self):
+        """
+        Forget the cached field index after the layer's fields change.
+        """
+        self._cached_index = None
+    
+    def _on_editing_stopped(self):
+        """
+        Forget the edit session and command once the layer leaves edit mode.
+        """
+        self._started_editing = False
+        self._edit_command_open = False
+    
+    def _on_after_commit(self):
+        """
+        Close the edit command and create the indexes deferred until the
+        rotation field was committed.
+        
+        The commit cleared the command's undo macro, so the next rotation
+        must open a new one.
+        """
+        if self._edit_command_open:
+            self._edit_command_open = False
+            if self.layer.isEditCommandActive():
+                self.layer.endEditCommand()
+        
+        if self._index_pending:
+            self._create_indexes()
     
     def field_exists(self) -> bool:
         """
@@ -62,7 +138,7 @@ class RotationFieldManager:
         
         if field_index < 0:
             self._create_rotation_field()
-            field_index = self.get_field_index()
+            field_index = self._cached_index
         
         return field_index
     
@@ -73,37 +149,182 @@ class RotationFieldManager:
         This is a private method called by ensure_rotation_field_exists.
         Uses LayerEditingContext for safe editing operations.
         """
+        # Indexes can only be built once the field reaches the provider,
+        # which _on_after_commit() picks up
+        self._index_pending = True
         with LayerEditingContext(self.layer) as lyr:
-            lyr.addAttribute(QgsField(self.ROTATION_FIELD, QVariant.Double))
+            lyr.addAttribute(QgsField(self._ROTATION_QFIELD))
             lyr.updateFields()
+        self._cached_index = self.layer.fields().indexOf(self.ROTATION_FIELD)
+    
+    def _create_indexes(self):
+        """
+        Create an attribute index on the rotation field.
+        
+        Providers that can't create indexes are reported through the
+        message helper, if there is one.
+        """
+        provider = self.layer.dataProvider()
+        
+        # The provider numbers its attributes independently of the layer
+        provider_index = provider.fieldNameIndex(self.ROTATION_FIELD)
+        if provider_index < 0:
+            return
+        
+        self._index_pending = False
+        if provider.capabilities() & QgsVectorDataProvider.CreateAttributeIndex:
+            provider.createAttributeIndex(provider_index)
+        elif self.message_helper:
+            self.message_helper.show_info(
+                f'The layer provider cannot index the {self.ROTATION_FIELD} field'
+            )
+        
+        self.ensure_spatial_index()
+    
+    def ensure_spatial_index(self):
+        """
+        Create a spatial index on the layer if its provider has none.
+        
+        Feature identification on click is much faster with a spatial index.
+        The provider is only checked once per manager.
+        """
+        if self._spatial_index_checked:
+            return
+        
+        self._spatial_index_checked = True
+        provider = self.layer.dataProvider()
+        if provider.hasSpatialIndex() != QgsFeatureSource.SpatialIndexNotPresent:
+            return
+        
+        if provider.capabilities() & QgsVectorDataProvider.CreateSpatialIndex:
+            provider.createSpatialIndex()
+        elif self.message_helper:
+            self.message_helper.show_info(
+                'The layer provider cannot create a spatial index'
+            )
+    
+    def get_rotation(self, feature, field_index: int) -> Optional[float]:
+        """
+        Get the rotation currently stored on a feature.
+        
+        Args:
+            feature: The QgsFeature to read from
+            field_index: The index of the rotation field
+        
+        Returns:
+            float: The stored rotation angle, or None if the feature has no
+                value (or was fetched before the field was created)
+        """
+        attributes = feature.attributes()
+        if not 0 <= field_index < len(attributes):
+            return None
+        
+        value = attributes[field_index]
+        if isinstance(value, (int, float)):
+            return float(value)
+        return None
+    
+    def begin_editing(self):
+        """
+        Open an edit session on the layer if it isn't already editable.
+        
+        The session is held open for the lifetime of the tool so each
+        rotation only touches the edit buffer. An edit session the user
+        opened themselves is left for them to commit.
+        """
+        if not self.layer.isEditable():
+            self._started_editing = self.layer.startEditing()
     
     def update_rotation(self, feature_id: int, field_index: int, azimuth: float):
         """
         Update the rotation value for a specific feature.
         
+        All rotations made until end_edit_command() are grouped into one
+        edit command, so they are undone together. Changes are saved to the
+        provider by commit_all().
+        
         Args:
             feature_id: The ID of the feature to update
             field_index: The index of the rotation field
             azimuth: The new rotation angle in degrees
         """
-        with LayerEditingContext(self.layer) as lyr:
-            lyr.changeAttributeValue(feature_id, field_index, azimuth)
+        if not self._edit_command_open:
+            self.layer.beginEditCommand('Rotate marker symbols')
+            self._edit_command_open = True
+        
+        self.layer.changeAttributeValue(feature_id, field_index, azimuth)
+    
+    def end_edit_command(self):
+        """
+        Close the edit command grouping the rotations made so far.
+        """
+        if self._edit_command_open:
+            self._edit_command_open = False
+            if self.layer.isEditCommandActive():
+                self.layer.endEditCommand()
+    
+    def discard_rotations(self):
+        """
+        Undo every rotation made since the edit command was opened.
+        """
+        if self._edit_command_open:
+            self._edit_command_open = False
+            # Never undo a command this manager didn't open
+            if self.layer.isEditCommandActive():
+                self.layer.destroyEditCommand()
+    
+    def commit_all(self) -> bool:
+        """
+        Commit all buffered rotations if this manager opened the edit session.
+        
+        If the commit fails the layer is left in edit mode, so the caller
+        can call rollback_all(). If the user opened the edit session the
+        rotations are only closed into an edit command, for the user to
+        commit or undo.
+        
+        Returns:
+            bool: True if the changes were committed (or there was nothing
+                to commit), False otherwise
+        """
+        self.end_edit_command()
+        
+        if not self._started_editing:
+            return True
+        
+        if not self.layer.commitChanges(stopEditing=True):
+            return False
+        
+        self._started_editing = False
+        return True
+    
+    def rollback_all(self):
+        """
+        Discard all buffered rotations if this manager opened the edit session.
+        """
+        self.discard_rotations()
+        
+        if self._started_editing:
+            self._started_editing = False
+            self._index_pending = False
+            self.layer.rollBack()
     
     def set_data_defined_rotation(self, symbols: list):
         """
         Configure symbols to use data-defined rotation from the rotation field.
         
         This sets up the symbols to read their rotation angle from the
-        rotation field attribute.
+        rotation field attribute. Symbols already bound to the field are
+        left untouched.
         
         Args:
             symbols: List of QgsSymbol objects to configure
         """
-        property_expression = QgsProperty.fromExpression(
-            f'"{self.ROTATION_FIELD}"'
-        )
+        property_expression = self._rotation_property()
         
         for symbol in symbols:
+            current = symbol.dataDefinedAngle()
+            if current.isActive() and current.expressionString() == self.ROTATION_FIELD_EXPR:
+                continue
             symbol.setDataDefinedAngle(property_expression)
     
     def set_dynamic_rotation(self, symbols: list, rotation: float):
@@ -117,8 +338,8 @@ class RotationFieldManager:
             symbols: List of QgsSymbol objects to update
             rotation: The rotation angle in degrees
         """
-        prop = QgsProperty()
-        prop.setExpressionString(f'{rotation}')
+        prop = self._dynamic_prop
+        prop.setStaticValue(rotation)
         
         for symbol in symbols:
             symbol.setDataDefinedAngle(prop)
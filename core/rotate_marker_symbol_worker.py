@@ -7,17 +7,26 @@ interactively rotate point marker symbols by clicking a point and dragging
 to set the rotation angle.
 """
 
-from qgis.core import QgsProject
+from qgis.core import (
+    QgsProject,
+    QgsRenderContext,
+    QgsCategorizedSymbolRenderer,
+    QgsGraduatedSymbolRenderer,
+    QgsRuleBasedRenderer
+)
 from qgis.gui import QgsMapToolIdentifyFeature, QgsMapToolIdentify
-from qgis.PyQt.QtCore import QVariant
+from qgis.PyQt.QtCore import Qt, QVariant
 
-from .helpers import LayerEditingContext, MessageHelper, MouseButton
+from .helpers import MessageHelper, MouseButton
 from .validators import LayerValidator
 from .field_manager import RotationFieldManager
 from .visual_feedback import VisualFeedbackManager
 from .rotation_state import RotationState
 from .snapping_config import SnappingConfigManager
-from .symbol_preview import SymbolPreviewManager
+
+
+# Mouse buttons that start or commit a rotation
+_COMMIT_BUTTONS = frozenset({MouseButton.LEFT, MouseButton.MIDDLE})
 
 
 class PointSymbolRotator(QgsMapToolIdentifyFeature):
@@ -38,8 +47,17 @@ class PointSymbolRotator(QgsMapToolIdentifyFeature):
     - A guide line showing the rotation direction
     - A symbol preview showing the rotated symbol directly on canvas
     - Snapping to allow precise angle alignment
+    
+    All rotations made while the tool is active form a single edit
+    command, which Escape discards.
     """
     
+    # Minimum cursor movement in pixels before snapping is queried again
+    SNAP_MIN_PIXEL_DELTA = 3
+    
+    # Renderers that expose their symbols through symbols(context)
+    _CLASSIFIED_RENDERERS = (QgsCategorizedSymbolRenderer, QgsGraduatedSymbolRenderer)
+    
     def __init__(self, canvas, iface, project=None):
         """
         Initialize the rotation tool.
@@ -67,14 +85,24 @@ class PointSymbolRotator(QgsMapToolIdentifyFeature):
         
         # Field manager will be created when we have a valid layer
         self.field_manager = None
+        self._field_managers = {}
+        
+        # Renderer symbols and successful validations per layer id,
+        # dropped when the renderer or its symbols change
+        self._symbols_cache = {}
+        self._valid_layers = set()
+        self._watched_layer = None
+        self._watch_layer(self.layer)
         
         # Validate initial layer
-        self.is_valid = self.validator.validate(self.layer) if self.layer else False
+        self.is_valid = self._validate_layer()
         
         # Set up snapping
         self.snapping_manager.configure_snapping()
         self.snap_indicator = self.visual_manager.initialize_snap_indicator()
         self.snap_utils = canvas.snappingUtils()
+        self.snapping_manager.configure_snapping_utils(self.snap_utils)
+        self._last_snap_pos = None
         
         # Connect to layer selection changes
         self.iface.layerTreeView().currentLayerChanged.connect(self.on_layer_changed)
@@ -94,16 +122,25 @@ class PointSymbolRotator(QgsMapToolIdentifyFeature):
         """
         # Update layer reference in case it changed
         self.layer = self.iface.activeLayer()
+        self._watch_layer(self.layer)
         
         # Revalidate if layer changed
-        self.is_valid = self.validator.validate(self.layer) if self.layer else False
+        self.is_valid = self._validate_layer()
         
         if not self.is_valid:
             return
         
         # Initialize field manager for this layer
         if not self.field_manager or self.field_manager.layer != self.layer:
-            self.field_manager = RotationFieldManager(self.layer)
+            self._commit_pending_edits()
+            self.field_manager = self._get_field_manager(self.layer)
+        
+        # Make sure identifying the clicked feature can use a spatial index
+        self.field_manager.ensure_spatial_index()
+        
+        # Hold the layer in edit mode so rotations only touch the edit buffer
+        if not self.layer.isEditable():
+            self.field_manager.begin_editing()
     
     def canvasReleaseEvent(self, event):
         """
@@ -123,11 +160,11 @@ class PointSymbolRotator(QgsMapToolIdentifyFeature):
         button = event.button()
         
         # Case 1: Start rotation operation
-        if button in (MouseButton.LEFT, MouseButton.MIDDLE) and not self.state.drawing_guide:
+        if button in _COMMIT_BUTTONS and not self.state.drawing_guide:
             self._start_rotation(event)
         
         # Case 2: Commit rotation
-        elif button in (MouseButton.LEFT, MouseButton.MIDDLE) and self.state.drawing_guide:
+        elif button in _COMMIT_BUTTONS and self.state.drawing_guide:
             self._commit_rotation()
         
         # Case 3: Cancel rotation
@@ -147,9 +184,13 @@ class PointSymbolRotator(QgsMapToolIdentifyFeature):
         if not self.is_valid:
             return
         
-        # Update snap indicator
-        snap_match = self.snap_utils.snapToMap(event.pos())
-        self.visual_manager.update_snap_indicator(snap_match)
+        # Update snap indicator, keeping the last match for tiny movements
+        pos = event.pos()
+        if (self._last_snap_pos is None or
+                (pos - self._last_snap_pos).manhattanLength() >= self.SNAP_MIN_PIXEL_DELTA):
+            self._last_snap_pos = pos
+            snap_match = self.snap_utils.snapToMap(pos)
+            self.visual_manager.update_snap_indicator(snap_match)
         
         # Update guide line and preview if actively rotating
         if self.state.drawing_guide and self.state.src_point:
@@ -164,6 +205,26 @@ class PointSymbolRotator(QgsMapToolIdentifyFeature):
             # Update preview with current rotation
             self.visual_manager.update_symbol_rotation(self.state.azimuth)
     
+    def keyPressEvent(self, event):
+        """
+        Handle key press events while the tool is active.
+        
+        Escape cancels the rotation in progress. When no rotation is in
+        progress it discards the rotations made during this tool session.
+        
+        Args:
+            event: The key event
+        """
+        if event.key() != Qt.Key_Escape:
+            event.ignore()
+            return
+        
+        if self.state.is_active:
+            self._cancel_rotation()
+        elif self.field_manager:
+            self.field_manager.discard_rotations()
+            self.field_manager.layer.triggerRepaint()
+    
     def _start_rotation(self, event):
         """
         Start a new rotation operation.
@@ -217,6 +278,15 @@ class PointSymbolRotator(QgsMapToolIdentifyFeature):
         if not self.state.is_active or self.state.azimuth is None:
             return
         
+        # Nothing to write if the feature already has this rotation
+        current = self.field_manager.get_rotation(
+            self.state.feature,
+            self.state.rotation_field_index
+        )
+        if current is not None and abs(current - self.state.azimuth) < 1e-6:
+            self._cleanup_after_rotation()
+            return
+        
         # Update the rotation attribute
         self.field_manager.update_rotation(
             self.state.feature_id,
@@ -224,9 +294,9 @@ class PointSymbolRotator(QgsMapToolIdentifyFeature):
             self.state.azimuth
         )
         
-        # Clean up
+        # Clean up and redraw only the edited layer
         self._cleanup_after_rotation()
-        self.canvas.refresh()
+        self.layer.triggerRepaint()
     
     def _cancel_rotation(self):
         """
@@ -241,27 +311,62 @@ class PointSymbolRotator(QgsMapToolIdentifyFeature):
         self.visual_manager.clear()
         self.state.reset()
     
+    def _validate_layer(self) -> bool:
+        """
+        Validate the current layer, reusing an earlier successful result.
+        
+        Failed validations are not cached so the user is told why the
+        layer can't be used each time they try.
+        
+        Returns:
+            bool: True if the layer can be used by the tool
+        """
+        if not self.layer:
+            return False
+        
+        layer_id = self.layer.id()
+        if layer_id in self._valid_layers:
+            return True
+        
+        is_valid = self.validator.validate(self.layer)
+        if is_valid:
+            self._valid_layers.add(layer_id)
+        return is_valid
+    
     def _get_layer_symbols(self) -> list:
         """
         Get all symbols from the current layer's renderer.
         
+        The symbols are cached per layer until its renderer changes.
+        
         Returns:
             list: List of QgsSymbol objects
         """
-        from qgis.core import (
-            QgsRenderContext,
-            QgsCategorizedSymbolRenderer,
-            QgsGraduatedSymbolRenderer,
-            QgsRuleBasedRenderer
-        )
+        if not self.layer:
+            return []
+        
+        layer_id = self.layer.id()
+        symbols = self._symbols_cache.get(layer_id)
+        if symbols is None:
+            symbols = self._compute_layer_symbols()
+            self._symbols_cache[layer_id] = symbols
         
+        return symbols
+    
+    def _compute_layer_symbols(self) -> list:
+        """
+        Walk the current layer's renderer to collect its symbols.
+        
+        Returns:
+            list: List of QgsSymbol objects
+        """
         if not self.layer:
             return []
         
         renderer = self.layer.renderer()
         symbols = []
         
-        if isinstance(renderer, (QgsCategorizedSymbolRenderer, QgsGraduatedSymbolRenderer)):
+        if isinstance(renderer, self._CLASSIFIED_RENDERERS):
             symbols = renderer.symbols(QgsRenderContext())
         elif isinstance(renderer, QgsRuleBasedRenderer):
             root_rule = renderer.rootRule()
@@ -285,7 +390,58 @@ class PointSymbolRotator(QgsMapToolIdentifyFeature):
         Returns:
             QgsSymbol: The symbol for this feature, or None if not found
         """
-        return SymbolPreviewManager.get_feature_symbol(self.layer, feature)
+        preview_manager = self.visual_manager.symbol_preview_manager
+        return preview_manager.get_feature_symbol(self.layer, feature)
+    
+    def _watch_layer(self, layer):
+        """
+        Track renderer and style changes on the given layer to keep caches
+        current.
+        
+        Editing a symbol from the legend deletes the old symbol and only
+        emits styleChanged, so that signal drops the caches too. Stops
+        watching the previously tracked layer and drops its cached symbols.
+        
+        Args:
+            layer: The layer to watch, or None to stop watching
+        """
+        if layer == self._watched_layer:
+            return
+        
+        if self._watched_layer is not None:
+            try:
+                self._watched_layer.rendererChanged.disconnect(self._on_renderer_changed)
+                self._watched_layer.styleChanged.disconnect(self._on_renderer_changed)
+                self._drop_layer_caches(self._watched_layer.id())
+            except (TypeError, RuntimeError):
+                # Signal was already disconnected or layer was deleted
+                pass
+        
+        self._watched_layer = layer
+        if layer is not None:
+            layer.rendererChanged.connect(self._on_renderer_changed)
+            layer.styleChanged.connect(self._on_renderer_changed)
+    
+    def _on_renderer_changed(self):
+        """
+        Drop cached renderer data for the watched layer.
+        """
+        if self._watched_layer is not None:
+            self._drop_layer_caches(self._watched_layer.id())
+    
+    def _drop_layer_caches(self, layer_id: str):
+        """
+        Forget cached symbols and validation results for a layer.
+        
+        Feature symbols cached by the preview manager are dropped for all
+        layers.
+        
+        Args:
+            layer_id: The ID of the layer
+        """
+        self._symbols_cache.pop(layer_id, None)
+        self._valid_layers.discard(layer_id)
+        self.visual_manager.symbol_preview_manager.clear_symbol_cache()
     
     def on_layer_changed(self, layer):
         """
@@ -301,17 +457,20 @@ class PointSymbolRotator(QgsMapToolIdentifyFeature):
         if layer is None:
             self.layer = None
             self.is_valid = False
+            self._watch_layer(None)
             return
         
         # Update the active layer reference
         self.layer = layer
+        self._watch_layer(self.layer)
         
         # Validate the new layer
-        self.is_valid = self.validator.validate(self.layer) if self.layer else False
+        self.is_valid = self._validate_layer()
         
-        # Reset field manager if layer changed
-        if self.layer and (not self.field_manager or self.field_manager.layer != self.layer):
-            self.field_manager = RotationFieldManager(self.layer)
+        # Reset field manager if the layer changed to another usable one
+        if self.is_valid and (not self.field_manager or self.field_manager.layer != self.layer):
+            self._commit_pending_edits()
+            self.field_manager = self._get_field_manager(self.layer)
         
         # Cancel any active rotation when layer changes
         if self.state.is_active:
@@ -321,7 +480,8 @@ class PointSymbolRotator(QgsMapToolIdentifyFeature):
         """
         Handle tool deactivation.
         
-        This cleans up all visual feedback and disconnects layer change signal.
+        This cleans up all visual feedback, disconnects layer change signal
+        and commits the rotations made while the tool was active.
         """
         # Disconnect layer change signal
         try:
@@ -330,21 +490,48 @@ class PointSymbolRotator(QgsMapToolIdentifyFeature):
             # Signal was already disconnected
             pass
         
-        self.visual_manager.clear()
+        self.visual_manager.deactivate()
         self.state.reset()
+        self._watch_layer(None)
+        self.snapping_manager.restore_snapping_utils()
+        
+        # Save the rotations buffered during this tool session
+        self._commit_pending_edits()
+        self._field_managers.clear()
     
-    def __del__(self):
+    def _get_field_manager(self, layer) -> RotationFieldManager:
         """
-        Destructor to ensure cleanup even if tool is garbage collected.
+        Get the field manager for a layer, reusing one made earlier this session.
         
-        This handles the case where QGIS is closed while the tool is active,
-        ensuring the preview layer doesn't persist in the project file.
+        Args:
+            layer: The QgsVectorLayer to manage the rotation field for
+        
+        Returns:
+            RotationFieldManager: The field manager for the layer
+        """
+        field_manager = self._field_managers.get(layer.id())
+        if field_manager is None:
+            field_manager = RotationFieldManager(layer, self.message_helper)
+            self._field_managers[layer.id()] = field_manager
+        return field_manager
+    
+    def _commit_pending_edits(self):
         """
+        Commit rotations buffered in the current field manager's edit session.
+        
+        The rotations are rolled back if the commit fails.
+        """
+        if not self.field_manager:
+            return
+        
         try:
-            self.preview_manager.cleanup()
-            self.visual_manager.clear()
-        except (AttributeError, RuntimeError):
-            # Objects may already be destroyed
+            if not self.field_manager.commit_all():
+                self.field_manager.rollback_all()
+                self.message_helper.show_critical(
+                    'The rotations could not be saved and were rolled back'
+                )
+        except RuntimeError:
+            # Layer may already have been deleted
             pass
     
     def remove_rubber_bands(self):
@@ -6,18 +6,17 @@ This module provides a clean way to manage the state during rotation operations,
 making it easier to track and reset state between operations.
 """
 
-from dataclasses import dataclass, field
 from typing import Optional
 from qgis.core import QgsFeature, QgsPointXY
 
 
-@dataclass
 class RotationState:
     """
     Encapsulates the state during a rotation operation.
     
-    This data class holds all the state information needed during an
+    This class holds all the state information needed during an
     active rotation operation, making it easy to reset and manage state.
+    Attributes are stored in slots since they are read on every mouse move.
     
     Attributes:
         feature: The feature currently being rotated
@@ -29,13 +28,27 @@ class RotationState:
         is_active: Whether a rotation operation is currently active
     """
     
-    feature: Optional[QgsFeature] = None
-    feature_id: Optional[int] = None
-    src_point: Optional[QgsPointXY] = None
-    drawing_guide: bool = False
-    azimuth: Optional[float] = None
-    rotation_field_index: int = -1
-    is_active: bool = False
+    __slots__ = (
+        'feature',
+        'feature_id',
+        'src_point',
+        'drawing_guide',
+        'azimuth',
+        'rotation_field_index',
+        'is_active',
+    )
+    
+    feature: Optional[QgsFeature]
+    feature_id: Optional[int]
+    src_point: Optional[QgsPointXY]
+    drawing_guide: bool
+    azimuth: Optional[float]
+    rotation_field_index: int
+    is_active: bool
+    
+    def __init__(self):
+        """Initialize with no active rotation."""
+        self.reset()
     
     def reset(self):
         """
@@ -76,11 +89,8 @@ class RotationState:
         Args:
             raw_azimuth: The raw azimuth value from QgsPointXY.azimuth()
         """
-        # Normalize from -180..180 to 0..360
-        if raw_azimuth < 0:
-            self.azimuth = raw_azimuth + 360.0
-        else:
-            self.azimuth = raw_azimuth
+        # Normalize to 0..360; also wraps any out-of-range value
+        self.azimuth = raw_azimuth % 360.0
     
     def finish_rotation(self):
         """
@@ -6,7 +6,8 @@ This module handles the setup and management of snapping behavior for
 precise feature selection and rotation operations.
 """
 
-from qgis.core import QgsProject, QgsSnappingConfig, QgsTolerance
+from typing import Optional
+from qgis.core import QgsProject, QgsSnappingConfig, QgsSnappingUtils, QgsTolerance
 
 
 class SnappingConfigManager:
@@ -28,23 +29,67 @@ class SnappingConfigManager:
             project: The QGIS project instance
         """
         self.project = project
+        self._snap_utils: Optional[QgsSnappingUtils] = None
+        self._previous_strategy = None
     
     def configure_snapping(self):
         """
         Configure snapping settings for the rotation tool.
         
         Sets up snapping to work with the active layer, targeting vertices
-        with a tolerance specified in pixels.
+        with a tolerance specified in pixels. The project config is left
+        untouched if it already matches, since replacing it invalidates the
+        snapping indexes.
         """
+        current = self.project.snappingConfig()
+        if (current.enabled() and
+                current.mode() == QgsSnappingConfig.ActiveLayer and
+                current.type() == QgsSnappingConfig.Vertex and
+                current.tolerance() == self.SNAP_TOLERANCE and
+                current.units() == QgsTolerance.Pixels and
+                not current.intersectionSnapping()):
+            return
+        
         snap_config = QgsSnappingConfig(self.project)
         snap_config.setEnabled(True)
         snap_config.setMode(QgsSnappingConfig.ActiveLayer)
         snap_config.setType(QgsSnappingConfig.Vertex)
         snap_config.setTolerance(self.SNAP_TOLERANCE)
         snap_config.setUnits(QgsTolerance.Pixels)
+        snap_config.setIntersectionSnapping(False)
         
         self.project.setSnappingConfig(snap_config)
     
+    def configure_snapping_utils(self, snap_utils: QgsSnappingUtils):
+        """
+        Limit the snapping index to features in the current map extent.
+        
+        Only the active layer is snapped to, so indexing the whole layer is
+        wasted work on large layers. The previous strategy is kept so it can
+        be put back by restore_snapping_utils().
+        
+        Args:
+            snap_utils: The canvas snapping utils used by the tool
+        """
+        self._snap_utils = snap_utils
+        self._previous_strategy = snap_utils.indexingStrategy()
+        snap_utils.setIndexingStrategy(QgsSnappingUtils.IndexExtent)
+    
+    def restore_snapping_utils(self):
+        """
+        Restore the indexing strategy replaced by configure_snapping_utils().
+        """
+        if self._snap_utils is None:
+            return
+        
+        try:
+            self._snap_utils.setIndexingStrategy(self._previous_strategy)
+        except RuntimeError:
+            # Canvas may already have been destroyed
+            pass
+        self._snap_utils = None
+        self._previous_strategy = None
+    
     def get_snap_config(self) -> QgsSnappingConfig:
         """
         Get the current snapping configuration.
@@ -7,21 +7,48 @@ preview with dynamic rotation directly on the map canvas, eliminating
 the need for a separate preview layer.
 """
 
-from typing import Optional
+from math import ceil, hypot
+from typing import Dict, List, Optional
 from qgis.core import (
     QgsFeature,
     QgsPointXY,
     QgsRenderContext,
     QgsSymbol,
+    QgsSymbolLayerUtils,
     QgsCategorizedSymbolRenderer,
     QgsGraduatedSymbolRenderer,
-    QgsRuleBasedRenderer,
     QgsSingleSymbolRenderer,
     QgsVectorLayer,
 )
 from qgis.gui import QgsMapCanvas, QgsMapCanvasItem
-from qgis.PyQt.QtCore import QPointF, QRectF
-from qgis.PyQt.QtGui import QPainter
+from qgis.PyQt.QtCore import Qt, QPointF, QRectF
+from qgis.PyQt.QtGui import QPainter, QPixmap, QPixmapCache, QTransform
+
+
+# Render contexts shared by symbol measuring, rendering and resolution;
+# they are only used from the GUI thread
+_CTX_POOL: List[QgsRenderContext] = []
+
+
+def _acquire_ctx() -> QgsRenderContext:
+    """
+    Take a render context from the pool, creating one if it is empty.
+    
+    Returns:
+        QgsRenderContext: A context to be handed back with _release_ctx()
+    """
+    return _CTX_POOL.pop() if _CTX_POOL else QgsRenderContext()
+
+
+def _release_ctx(render_context: QgsRenderContext):
+    """
+    Return a render context to the pool.
+    
+    Args:
+        render_context: The context taken with _acquire_ctx()
+    """
+    render_context.setPainter(None)
+    _CTX_POOL.append(render_context)
 
 
 class SymbolPreviewCanvasItem(QgsMapCanvasItem):
@@ -32,13 +59,40 @@ class SymbolPreviewCanvasItem(QgsMapCanvasItem):
     by rendering a symbol directly on the map canvas. It supports transparency
     to indicate that it's a preview, not the actual feature.
     
-    The symbol is rendered using QgsSymbol.renderPoint() for accurate
-    representation of all symbol properties including size, color, and
-    complex symbol layers.
+    The symbol is rendered once at 0 degrees into a pixmap using
+    QgsSymbol.renderPoint() for accurate representation of all symbol
+    properties including size, color, and complex symbol layers. Rotation
+    is then applied by the painter, so the symbol layers are not
+    re-rendered on every mouse move.
+    
+    No __slots__ are declared here: the SIP wrapper base already gives
+    instances a __dict__, so slots would not save any memory.
+    
+    Attributes:
+        canvas: The map canvas the item is drawn on
+        _symbol: The cloned symbol, kept at 0 degrees
+        _point: The map coordinates of the symbol origin
+        _rotation: The current painter rotation in degrees
+        _opacity: The preview opacity
+        _pixmap: The rendered symbol, shared through QPixmapCache
+        _pixmap_dirty: Whether the pixmap must be re-rendered
+        _pixmap_metrics: The (pixel ratio, DPI) the pixmap was rendered for
+        _bbox_radius: Half the width of the square bounding rect
+        _pm_origin: The top-left corner the pixmap is drawn at
+        _symbol_bounds: The measured symbol extent at 0 degrees
     """
     
     DEFAULT_OPACITY = 0.45  # Match the previous preview layer opacity
     
+    # Radius in pixels used when the symbol extent can't be measured
+    FALLBACK_RADIUS = 64
+    
+    # Extra pixels around the measured symbol extent for antialiasing
+    RADIUS_PADDING = 2
+    
+    # Minimum change in degrees before a new rotation is repainted
+    UPDATE_THRESHOLD_DEG = 0.25
+    
     def __init__(self, canvas: QgsMapCanvas, symbol: QgsSymbol, point: QgsPointXY):
         """
         Initialize the symbol preview canvas item.
@@ -55,10 +109,23 @@ class SymbolPreviewCanvasItem(QgsMapCanvasItem):
         self._point = point
         self._rotation = 0.0
         self._opacity = self.DEFAULT_OPACITY
+        self._pixmap: Optional[QPixmap] = None
+        self._pixmap_dirty = True
+        self._pixmap_metrics = None
+        self._bbox_radius = float(self.FALLBACK_RADIUS)
+        self._pm_origin = QPointF(-self._bbox_radius, -self._bbox_radius)
+        self._symbol_bounds = self.boundingRect()
+        
+        # Render at 0 degrees; the painter applies the rotation
+        if hasattr(self._symbol, 'setAngle'):
+            self._symbol.setAngle(0)
         
         # Apply initial opacity to symbol layers
         self._apply_opacity_to_symbol()
         
+        # Render up front so boundingRect() reflects the symbol extent
+        self._ensure_pixmap()
+        
         # Set initial position
         self._update_position()
         
@@ -85,23 +152,198 @@ class SymbolPreviewCanvasItem(QgsMapCanvasItem):
         
         # QgsSymbol has setOpacity at the symbol level
         self._symbol.setOpacity(self._opacity)
+        self._pixmap_dirty = True
+    
+    def _ensure_pixmap(self):
+        """
+        Render the symbol into the cached pixmap if it is out of date.
+        
+        The pixmap is rendered at the canvas device pixel ratio so the
+        preview stays sharp on HiDPI screens. Rendered pixmaps are shared
+        through QPixmapCache, so previews of identical symbols (e.g.
+        features in the same category) reuse them.
+        
+        This may change the item geometry, so it must not be called from
+        paint().
+        """
+        dpr = self.canvas.devicePixelRatioF()
+        dpi = self.canvas.logicalDpiX()
+        
+        # Also re-render when the canvas moves to a screen with another
+        # pixel ratio or DPI
+        if (not self._pixmap_dirty and self._pixmap is not None and
+                self._pixmap_metrics == (dpr, dpi)):
+            return
+        
+        bounds = self._measure_symbol(dpi)
+        
+        cache_key = self._pixmap_cache_key(dpr, dpi)
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = self._render_pixmap(dpr, dpi, self._radius_for(bounds))
+            QPixmapCache.insert(cache_key, pixmap)
+        
+        # The pixmap is square and centred on the symbol origin
+        radius = pixmap.width() / pixmap.devicePixelRatio() / 2
+        if radius != self._bbox_radius:
+            self.prepareGeometryChange()
+            self._bbox_radius = radius
+            self._pm_origin = QPointF(-radius, -radius)
+        
+        self._symbol_bounds = bounds
+        self._pixmap = pixmap
+        self._pixmap_metrics = (dpr, dpi)
+        self._pixmap_dirty = False
     
-    def setRotation(self, angle: float):
+    def _render_pixmap(self, dpr: float, dpi: float, radius: float) -> QPixmap:
+        """
+        Render the symbol at 0 degrees into a new pixmap.
+        
+        The pixmap is a square of the given radius with the symbol origin
+        at its centre.
+        
+        Args:
+            dpr: The canvas device pixel ratio
+            dpi: The canvas logical DPI
+            radius: Half the pixmap width in pixels
+        
+        Returns:
+            QPixmap: The rendered symbol
+        """
+        device_size = ceil(2 * radius * dpr)
+        pixmap = QPixmap(device_size, device_size)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        
+        center = device_size / dpr / 2
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        render_context = _acquire_ctx()
+        try:
+            render_context.setPainter(painter)
+            render_context.setFlag(QgsRenderContext.Antialiasing, True)
+            # Size the symbol as it would be when painted on the canvas
+            render_context.setScaleFactor(dpi / 25.4)
+            
+            self._symbol.startRender(render_context)
+            try:
+                self._symbol.renderPoint(QPointF(center, center), None, render_context)
+            finally:
+                self._symbol.stopRender(render_context)
+        finally:
+            _release_ctx(render_context)
+            painter.end()
+        
+        return pixmap
+    
+    def _measure_symbol(self, dpi: float) -> QRectF:
+        """
+        Measure the symbol extent around its origin at 0 degrees, in pixels.
+        
+        Args:
+            dpi: The canvas logical DPI
+        
+        Returns:
+            QRectF: The symbol bounds including antialiasing padding, or a
+                square of FALLBACK_RADIUS if the symbol can't be measured
+        """
+        fallback = QRectF(
+            -self.FALLBACK_RADIUS, -self.FALLBACK_RADIUS,
+            2 * self.FALLBACK_RADIUS, 2 * self.FALLBACK_RADIUS
+        )
+        if not hasattr(self._symbol, 'bounds'):
+            return fallback
+        
+        render_context = _acquire_ctx()
+        try:
+            render_context.setScaleFactor(dpi / 25.4)
+            
+            self._symbol.startRender(render_context)
+            try:
+                bounds = self._symbol.bounds(QPointF(0, 0), render_context)
+            finally:
+                self._symbol.stopRender(render_context)
+        finally:
+            _release_ctx(render_context)
+        
+        if bounds.isNull():
+            return fallback
+        
+        padding = self.RADIUS_PADDING
+        return bounds.adjusted(-padding, -padding, padding, padding)
+    
+    @staticmethod
+    def _radius_for(bounds: QRectF) -> int:
+        """
+        Get the radius of a circle around the origin containing the bounds.
+        
+        The distance to the furthest corner is used, so the circle holds
+        the symbol at any rotation.
+        
+        Args:
+            bounds: The symbol bounds at 0 degrees
+        
+        Returns:
+            int: The radius in pixels
+        """
+        extent_x = max(abs(bounds.left()), abs(bounds.right()))
+        extent_y = max(abs(bounds.top()), abs(bounds.bottom()))
+        return ceil(hypot(extent_x, extent_y))
+    
+    def _rotated_bbox(self, angle: float) -> QRectF:
+        """
+        Get the axis-aligned box covering the symbol rotated to an angle.
+        
+        Args:
+            angle: The rotation angle in degrees
+        
+        Returns:
+            QRectF: The box in item coordinates
+        """
+        return QTransform().rotate(angle).mapRect(self._symbol_bounds)
+    
+    def _pixmap_cache_key(self, dpr: float, dpi: float) -> str:
+        """
+        Build the QPixmapCache key for the symbol as currently configured.
+        
+        The key is derived from the symbol's full XML definition, so it
+        changes with any property that affects the rendered pixmap.
+        
+        Args:
+            dpr: The canvas device pixel ratio
+            dpi: The canvas logical DPI
+        
+        Returns:
+            str: The cache key
+        """
+        definition = QgsSymbolLayerUtils.symbolProperties(self._symbol)
+        return f'rotate_marker_symbol:{hash(definition)}:{dpr}:{dpi}'
+    
+    def setRotation(self, angle: float, force: bool = False):
         """
         Set the rotation angle for the symbol preview.
         
+        Only the painter rotation changes; the cached pixmap is kept.
+        Changes smaller than UPDATE_THRESHOLD_DEG are ignored since they
+        aren't visible, unless force is set.
+        
         Args:
             angle: The rotation angle in degrees (azimuth)
+            force: Apply the angle even if the change is below the threshold
         """
-        self._rotation = angle
+        delta = (angle - self._rotation + 180.0) % 360.0 - 180.0
+        if abs(delta) < self.UPDATE_THRESHOLD_DEG and not force:
+            return
         
-        # Apply rotation to the symbol
-        # For marker symbols, we can set the angle directly
-        if hasattr(self._symbol, 'setAngle'):
-            self._symbol.setAngle(angle)
+        # The canvas may have moved to a screen with another pixel ratio
+        self._ensure_pixmap()
+        
+        # Only the area covered by the symbol before and after needs repainting
+        dirty_rect = self._rotated_bbox(self._rotation).united(self._rotated_bbox(angle))
+        self._rotation = angle
         
         # Request repaint
-        self.update()
+        self.update(dirty_rect)
     
     def setOpacity(self, opacity: float):
         """
@@ -110,8 +352,13 @@ class SymbolPreviewCanvasItem(QgsMapCanvasItem):
         Args:
             opacity: Opacity value between 0.0 (transparent) and 1.0 (opaque)
         """
-        self._opacity = max(0.0, min(1.0, opacity))
+        clamped = max(0.0, min(1.0, opacity))
+        if clamped == self._opacity:
+            return
+        
+        self._opacity = clamped
         self._apply_opacity_to_symbol()
+        self._ensure_pixmap()
         self.update()
     
     def boundingRect(self) -> QRectF:
@@ -119,58 +366,56 @@ class SymbolPreviewCanvasItem(QgsMapCanvasItem):
         Return the bounding rectangle for the canvas item.
         
         This determines the area that needs to be repainted when the
-        item is updated. We use a generous size to accommodate large symbols.
+        item is updated. It is the square holding the symbol at any rotation.
         """
-        # Use a reasonable size that should cover most symbols
-        # The actual symbol size is determined by the render context
-        size = 100  # pixels - should be enough for most marker symbols
-        return QRectF(-size, -size, size * 2, size * 2)
+        radius = self._bbox_radius
+        return QRectF(-radius, -radius, radius * 2, radius * 2)
     
     def paint(self, painter: QPainter, option=None, widget=None):
         """
         Paint the symbol on the canvas.
         
         This method is called by Qt whenever the item needs to be redrawn.
-        It creates a render context and uses QgsSymbol.renderPoint() to
-        draw the symbol with the current rotation.
+        It draws the cached symbol pixmap rotated to the current angle
+        around the item origin.
         
         Args:
             painter: The QPainter to draw with
             option: Style options (unused)
             widget: The widget being painted on (unused)
         """
-        if not self._symbol or not self._point:
+        # The pixmap is kept current outside paint(), as re-rendering it
+        # can change the item geometry
+        if not self._symbol or not self._point or self._pixmap is None:
             return
         
-        # Save painter state
-        painter.save()
+        # Save only the painter state changed below; a full save() would
+        # snapshot pen, brush, font, clip etc. on every frame
+        prev_opacity = painter.opacity()
+        prev_transform = painter.transform()
+        prev_smooth = bool(painter.renderHints() & QPainter.SmoothPixmapTransform)
         
-        # Apply opacity
+        # Apply opacity and rotation
         painter.setOpacity(self._opacity)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter.rotate(self._rotation)
         
-        # Create render context from painter
-        render_context = QgsRenderContext.fromQPainter(painter)
-        
-        if render_context:
-            # Start rendering the symbol
-            self._symbol.startRender(render_context)
-            
-            try:
-                # Render at origin (0, 0) since we've already positioned the item
-                self._symbol.renderPoint(QPointF(0, 0), None, render_context)
-            finally:
-                # Always stop rendering
-                self._symbol.stopRender(render_context)
+        # Draw centered on the origin since we've already positioned the item
+        painter.drawPixmap(self._pm_origin, self._pixmap)
         
         # Restore painter state
-        painter.restore()
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, prev_smooth)
+        painter.setTransform(prev_transform)
+        painter.setOpacity(prev_opacity)
     
     def updatePosition(self):
         """
         Update position when the map canvas is panned or zoomed.
         
-        This is called automatically by the canvas when the view changes.
+        This is called automatically by the canvas when the view changes,
+        which is also when a changed pixel ratio or DPI is picked up.
         """
+        self._ensure_pixmap()
         self._update_position()
 
 
@@ -183,6 +428,11 @@ class SymbolPreviewManager:
     the appropriate symbol from different renderer types.
     """
     
+    __slots__ = ('canvas', 'preview_item', '_symbol_cache')
+    
+    # Maximum number of symbols kept by get_feature_symbol()
+    SYMBOL_CACHE_SIZE = 32
+    
     def __init__(self, canvas: QgsMapCanvas):
         """
         Initialize the symbol preview manager.
@@ -192,6 +442,7 @@ class SymbolPreviewManager:
         """
         self.canvas = canvas
         self.preview_item: Optional[SymbolPreviewCanvasItem] = None
+        self._symbol_cache: Dict[tuple, QgsSymbol] = {}
     
     def create_preview(self, point: QgsPointXY, symbol: QgsSymbol, 
                        initial_rotation: float = 0.0) -> SymbolPreviewCanvasItem:
@@ -211,7 +462,7 @@ class SymbolPreviewManager:
         
         # Create new preview item
         self.preview_item = SymbolPreviewCanvasItem(self.canvas, symbol, point)
-        self.preview_item.setRotation(initial_rotation)
+        self.preview_item.setRotation(initial_rotation, force=True)
         
         return self.preview_item
     
@@ -228,20 +479,25 @@ class SymbolPreviewManager:
     def remove_preview(self):
         """Remove the current symbol preview from the canvas."""
         if self.preview_item:
-            # Remove from canvas scene
-            scene = self.canvas.scene()
-            if scene and self.preview_item in scene.items():
+            # Remove from the scene the item belongs to, if any
+            scene = self.preview_item.scene()
+            if scene is not None:
                 scene.removeItem(self.preview_item)
             self.preview_item = None
     
-    @staticmethod
-    def get_feature_symbol(layer: QgsVectorLayer, feature: QgsFeature) -> Optional[QgsSymbol]:
+    def clear_symbol_cache(self):
+        """Forget the symbols cached by get_feature_symbol()."""
+        self._symbol_cache.clear()
+    
+    def get_feature_symbol(self, layer: QgsVectorLayer, feature: QgsFeature) -> Optional[QgsSymbol]:
         """
         Get the symbol used to render a specific feature.
         
         This method handles different renderer types (single symbol,
         categorized, graduated, rule-based) to return the correct symbol
-        for the given feature.
+        for the given feature. Symbols for single symbol renderers and
+        field-based categorized or graduated renderers are cached by
+        category value, so callers must clone the symbol before changing it.
         
         Args:
             layer: The layer containing the feature
@@ -257,36 +513,77 @@ class SymbolPreviewManager:
         if not renderer:
             return None
         
-        # Create a render context for symbol resolution
-        render_context = QgsRenderContext()
+        cache_key = self._symbol_cache_key(layer, renderer, feature)
+        if cache_key is not None:
+            symbol = self._symbol_cache.get(cache_key)
+            if symbol is not None:
+                return symbol
+        
+        symbol = self._resolve_feature_symbol(renderer, feature)
+        
+        if symbol is not None and cache_key is not None:
+            # Drop the oldest entry once the cache is full
+            if len(self._symbol_cache) >= self.SYMBOL_CACHE_SIZE:
+                del self._symbol_cache[next(iter(self._symbol_cache))]
+            self._symbol_cache[cache_key] = symbol
+        
+        return symbol
+    
+    @staticmethod
+    def _symbol_cache_key(layer: QgsVectorLayer, renderer, feature: QgsFeature) -> Optional[tuple]:
+        """
+        Build the cache key identifying which symbol a feature gets.
+        
+        Args:
+            layer: The layer containing the feature
+            renderer: The layer's renderer
+            feature: The feature to get the symbol for
         
-        # Single symbol renderer
+        Returns:
+            tuple: The cache key, or None if the symbol can't be cached
+                (rule-based or expression-based classification)
+        """
         if isinstance(renderer, QgsSingleSymbolRenderer):
-            return renderer.symbol().clone()
+            return (layer.id(),)
         
-        # Categorized renderer
-        elif isinstance(renderer, QgsCategorizedSymbolRenderer):
-            # Get the symbol for this feature's category
-            symbol = renderer.symbolForFeature(feature, render_context)
-            return symbol.clone() if symbol else None
+        if isinstance(renderer, (QgsCategorizedSymbolRenderer, QgsGraduatedSymbolRenderer)):
+            field_index = feature.fields().indexOf(renderer.classAttribute())
+            if field_index < 0:
+                return None
+            
+            value = feature.attribute(field_index)
+            try:
+                hash(value)
+            except TypeError:
+                return None
+            return (layer.id(), value)
         
-        # Graduated renderer
-        elif isinstance(renderer, QgsGraduatedSymbolRenderer):
-            symbol = renderer.symbolForFeature(feature, render_context)
-            return symbol.clone() if symbol else None
+        return None
+    
+    def _resolve_feature_symbol(self, renderer, feature: QgsFeature) -> Optional[QgsSymbol]:
+        """
+        Ask the renderer for the symbol of a feature.
         
-        # Rule-based renderer
-        elif isinstance(renderer, QgsRuleBasedRenderer):
-            symbol = renderer.symbolForFeature(feature, render_context)
-            return symbol.clone() if symbol else None
+        Args:
+            renderer: The layer's renderer
+            feature: The feature to get the symbol for
         
-        # Fallback: try generic symbolForFeature
+        Returns:
+            A clone of the feature's QgsSymbol, or None if not found
+        """
+        # Single symbol renderers are the fast path; categorized, graduated
+        # and rule-based renderers all resolve through symbolForFeature
+        if isinstance(renderer, QgsSingleSymbolRenderer):
+            symbol = renderer.symbol()
         elif hasattr(renderer, 'symbolForFeature'):
-            symbol = renderer.symbolForFeature(feature, render_context)
-            return symbol.clone() if symbol else None
-        
-        # Last resort: try to get any symbol
+            render_context = _acquire_ctx()
+            try:
+                symbol = renderer.symbolForFeature(feature, render_context)
+            finally:
+                _release_ctx(render_context)
         elif hasattr(renderer, 'symbol'):
-            return renderer.symbol().clone()
+            symbol = renderer.symbol()
+        else:
+            return None
         
-        return None
+        return symbol.clone() if symbol else None
@@ -26,6 +26,14 @@ class LayerValidator:
     of concerns from the main tool logic.
     """
     
+    # Renderer types the rotation tool can work with
+    _COMPATIBLE_RENDERERS = (
+        QgsSingleSymbolRenderer,
+        QgsCategorizedSymbolRenderer,
+        QgsRuleBasedRenderer,
+        QgsGraduatedSymbolRenderer,
+    )
+    
     def __init__(self, message_helper: MessageHelper):
         """
         Initialize the validator.
@@ -76,13 +84,7 @@ class LayerValidator:
         Returns:
             bool: True if the renderer is compatible, False otherwise
         """
-        is_valid = isinstance(
-            renderer,
-            (QgsSingleSymbolRenderer,
-             QgsCategorizedSymbolRenderer,
-             QgsRuleBasedRenderer,
-             QgsGraduatedSymbolRenderer)
-        )
+        is_valid = isinstance(renderer, LayerValidator._COMPATIBLE_RENDERERS)
         
         if not is_valid:
             self.message_helper.show_critical(
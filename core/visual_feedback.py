@@ -6,7 +6,7 @@ This module handles all visual feedback elements including rubber bands,
 snap indicators, symbol previews, and visual guides shown during rotation operations.
 """
 
-from typing import List, Optional
+from typing import Optional
 from qgis.core import Qgis, QgsGeometry, QgsPointXY, QgsSymbol
 from qgis.gui import QgsRubberBand, QgsSnapIndicator
 from qgis.PyQt.QtGui import QColor
@@ -25,9 +25,23 @@ class VisualFeedbackManager:
     - Snap indicators for precise positioning
     """
     
+    __slots__ = (
+        'canvas',
+        '_point_rb',
+        'guide_rubber_band',
+        '_guide_active',
+        '_last_start',
+        '_last_end',
+        'snap_indicator',
+        '_last_snap_key',
+        'symbol_preview_manager',
+    )
+    
     # Visual appearance constants
     POINT_COLOR = (0, 255, 0, 255)  # Green RGBA
     GUIDE_COLOR = (0, 0, 255, 255)  # Blue RGBA
+    POINT_QCOLOR = QColor(*POINT_COLOR)
+    GUIDE_QCOLOR = QColor(*GUIDE_COLOR)
     POINT_WIDTH = 2
     GUIDE_WIDTH = 1
     
@@ -39,38 +53,51 @@ class VisualFeedbackManager:
             canvas: The QGIS map canvas
         """
         self.canvas = canvas
-        self.rubber_bands: List[QgsRubberBand] = []
-        self.guide_rubber_band: Optional[QgsRubberBand] = None
+        
+        # Rubber bands live as long as the tool and are hidden between rotations
+        self._point_rb = QgsRubberBand(canvas, Qgis.GeometryType.Point)
+        self._point_rb.setColor(self.POINT_QCOLOR)
+        self._point_rb.setWidth(self.POINT_WIDTH)
+        self._point_rb.setVisible(False)
+        
+        self.guide_rubber_band = QgsRubberBand(canvas, Qgis.GeometryType.Line)
+        self.guide_rubber_band.setColor(self.GUIDE_QCOLOR)
+        self.guide_rubber_band.setWidth(self.GUIDE_WIDTH)
+        self.guide_rubber_band.setVisible(False)
+        
+        # Whether a rotation is drawing the guide line; the band's own
+        # visibility can't tell, as the canvas hides bands without points
+        self._guide_active = False
+        
+        self._last_start: Optional[QgsPointXY] = None
+        self._last_end: Optional[QgsPointXY] = None
         self.snap_indicator: Optional[QgsSnapIndicator] = None
+        self._last_snap_key = None
         self.symbol_preview_manager = SymbolPreviewManager(canvas)
     
     def create_point_rubber_band(self, point: QgsPointXY):
         """
-        Create a rubber band to highlight a selected point.
+        Show the point rubber band to highlight a selected point.
         
         Args:
             point: The point coordinates to highlight
         """
-        rb = QgsRubberBand(self.canvas, Qgis.GeometryType.Point)
-        rb.setColor(QColor(*self.POINT_COLOR))
-        rb.setWidth(self.POINT_WIDTH)
-        rb.addPoint(point)
-        self.rubber_bands.append(rb)
+        # setToGeometry() resets the band, so the scene is updated only once
+        self._point_rb.setToGeometry(QgsGeometry.fromPointXY(point), None)
+        self._point_rb.setVisible(True)
     
     def create_guide_line(self):
         """
-        Create a rubber band for the rotation guide line.
+        Show the rubber band for the rotation guide line.
         
         This line shows the direction and angle of rotation as the user
         moves the mouse.
         """
-        self.guide_rubber_band = QgsRubberBand(
-            self.canvas, 
-            Qgis.GeometryType.Line
-        )
-        self.guide_rubber_band.setColor(QColor(*self.GUIDE_COLOR))
-        self.guide_rubber_band.setWidth(self.GUIDE_WIDTH)
-        self.rubber_bands.append(self.guide_rubber_band)
+        self.guide_rubber_band.reset(Qgis.GeometryType.Line)
+        self._guide_active = True
+        self._last_start = None
+        self._last_end = None
+        self.guide_rubber_band.setVisible(True)
     
     def update_guide_line(self, start_point: QgsPointXY, end_point: QgsPointXY):
         """
@@ -80,9 +107,30 @@ class VisualFeedbackManager:
             start_point: The center point (feature location)
             end_point: The current cursor position
         """
-        if self.guide_rubber_band and start_point:
-            geometry = QgsGeometry.fromPolylineXY([start_point, end_point])
-            self.guide_rubber_band.setToGeometry(geometry)
+        if not self._guide_active or not start_point:
+            return
+        
+        rb = self.guide_rubber_band
+        if rb.numberOfVertices() < 2:
+            # Seed the two vertices once; later updates move them in place
+            rb.addPoint(start_point, False)
+            rb.addPoint(end_point, True)
+            rb.setVisible(True)
+            self._last_start = start_point
+            self._last_end = end_point
+            return
+        
+        # Skip sub-pixel cursor moves, which wouldn't change the drawn line
+        start_moved = start_point != self._last_start
+        epsilon = self.canvas.mapUnitsPerPixel() * 0.5
+        if not start_moved and self._last_end.compare(end_point, epsilon):
+            return
+        
+        if start_moved:
+            rb.movePoint(0, start_point)
+            self._last_start = start_point
+        rb.movePoint(1, end_point)
+        self._last_end = end_point
     
     def initialize_snap_indicator(self):
         """
@@ -92,6 +140,7 @@ class VisualFeedbackManager:
             QgsSnapIndicator: The initialized snap indicator
         """
         self.snap_indicator = QgsSnapIndicator(self.canvas)
+        self._last_snap_key = None
         return self.snap_indicator
     
     def update_snap_indicator(self, snap_match):
@@ -101,21 +150,37 @@ class VisualFeedbackManager:
         Args:
             snap_match: The QgsPointLocator.Match object from snapping utils
         """
-        if self.snap_indicator:
-            self.snap_indicator.setMatch(snap_match)
+        if not self.snap_indicator:
+            return
+        
+        # Skip the update if the indicator would show the same match
+        snap_key = (snap_match.type(), snap_match.point()) if snap_match.isValid() else None
+        if snap_key == self._last_snap_key:
+            return
+        
+        self._last_snap_key = snap_key
+        self.snap_indicator.setMatch(snap_match)
     
     def remove_all_rubber_bands(self):
         """
-        Remove all rubber bands from the canvas.
+        Clear and hide all rubber bands.
         
-        This should be called when the tool is deactivated or when
-        starting a new rotation operation.
+        This should be called when a rotation operation ends. The rubber
+        bands stay on the canvas for reuse until deactivate() is called.
         """
-        for rubber_band in self.rubber_bands:
-            self.canvas.scene().removeItem(rubber_band)
+        # Nothing to clear if no rotation has shown them since the last call
+        if not self._guide_active and not self._point_rb.isVisible():
+            return
+        
+        for rubber_band, geometry_type in (
+                (self._point_rb, Qgis.GeometryType.Point),
+                (self.guide_rubber_band, Qgis.GeometryType.Line)):
+            rubber_band.reset(geometry_type)
+            rubber_band.setVisible(False)
         
-        self.rubber_bands.clear()
-        self.guide_rubber_band = None
+        self._guide_active = False
+        self._last_start = None
+        self._last_end = None
     
     def create_symbol_preview(self, point: QgsPointXY, symbol: QgsSymbol, 
                                initial_rotation: float = 0.0):
@@ -150,3 +215,16 @@ class VisualFeedbackManager:
         """
         self.remove_all_rubber_bands()
         self.remove_symbol_preview()
+    
+    def deactivate(self):
+        """
+        Remove all visual feedback elements, including the reusable rubber
+        bands, from the canvas.
+        
+        This should be called when the tool is deactivated for good.
+        """
+        self.clear()
+        for rubber_band in (self._point_rb, self.guide_rubber_band):
+            scene = rubber_band.scene()
+            if scene is not None:
+                scene.removeItem(rubber_band)
@@ -195,7 +195,7 @@ class RotateMarkerSymbol:
 
         # Clean up map tool if it exists
         if self.point_symbol_rotator:
-            self.point_symbol_rotator.visual_manager.clear()
+            self.point_symbol_rotator.visual_manager.deactivate()
             # Unset map tool if it's ours
             if self.iface.mapCanvas().mapTool() == self.point_symbol_rotator:
                 self.iface.mapCanvas().unsetMapTool(self.point_symbol_rotator)